@@ -1,15 +1,32 @@
+import io
+import os
+import re
 import sys
-import json
 import time
+import ssl
+import atexit
+import socket
+import tarfile
+import asyncio
 import logging
+import tempfile
+import posixpath
+import threading
+import multiprocessing
 import concurrent.futures
+import orjson
+import aiohttp
 import schedule
+import requests
+import zstandard as zstd
 import pandas as pd
-from os import environ, remove
-from pathlib import Path
-from ftplib import FTP_TLS, error_perm
-from contextlib import contextmanager
-from typing import Dict, Any, Optional
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from os import environ
+from concurrent.futures.process import BrokenProcessPool
+from ftplib import FTP, FTP_TLS, all_errors, error_perm, error_reply
+from contextlib import contextmanager, ExitStack
+from typing import Dict, Any, Optional, AsyncIterator, BinaryIO, Iterator, List, Set, Tuple
 from dataclasses import dataclass
 
 # Configure logging
@@ -23,6 +40,144 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Block size for FTP uploads (ftplib defaults to 8 KiB)
+TRANSFER_BLOCKSIZE = 1 << 20
+
+# zstd level for sources with COMPRESS enabled (level 3 compresses at hundreds of MB/s per core)
+ZSTD_LEVEL = 3
+
+# Kernel send buffer for FTP data connections
+DATA_SNDBUF = 1 << 22
+
+# pandas read_csv PARAMS that have a pyarrow equivalent
+ARROW_SUPPORTED_PARAMS = {"names", "sep", "delimiter", "encoding", "na_values", "skiprows", "skipfooter", "engine"}
+
+# Strings pandas reads as missing by default (pyarrow's defaults lack "<NA>" and "None")
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+]
+
+# Block size pyarrow parses CSVs in
+ARROW_BLOCK_SIZE = 1 << 22
+
+# Staged CSVs larger than this spill from memory to a temporary file
+# (overridable per source via IN_MEMORY_MAX_BYTES)
+IN_MEMORY_MAX_BYTES = 64 << 20
+
+# Downloaded CSVs waiting for the parallel uploader (bounds memory held in flight)
+UPLOAD_QUEUE_SIZE = 4
+
+# Rows per DataFrame chunk when parsing CSVs (overridable per source via CHUNKSIZE)
+DEFAULT_CHUNKSIZE = 100_000
+
+class TunedFTP_TLS(FTP_TLS):
+    """FTP_TLS that resumes TLS sessions and uses a larger send buffer on data connections"""
+    
+    def __init__(self, *args, session: Optional[ssl.SSLSession] = None, **kwargs):
+        self._resume_session = session
+        super().__init__(*args, **kwargs)
+    
+    def auth(self):
+        """Set up secure control connection, resuming a saved TLS session if one was given"""
+        if isinstance(self.sock, ssl.SSLSocket):
+            raise ValueError("Already using TLS")
+        resp = self.voidcmd("AUTH TLS")
+        self.sock = self.context.wrap_socket(self.sock, server_hostname=self.host,
+                                             session=self._resume_session)
+        self.file = self.sock.makefile(mode="r", encoding=self.encoding)
+        return resp
+    
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = FTP.ntransfercmd(self, cmd, rest)
+        if self._prot_p:
+            # Data connections resume the control session (required by vsftpd's require_ssl_reuse)
+            conn = self.context.wrap_socket(conn, server_hostname=self.host, session=self.sock.session)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, DATA_SNDBUF)
+        return conn, size
+
+class PrefixedReader(io.RawIOBase):
+    """Binary stream returning ``prefix`` and then the rest of ``stream``, so peeked bytes are not lost"""
+    
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        self._prefix = memoryview(prefix)
+        self._stream = stream
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        if self._prefix:
+            n = min(len(b), len(self._prefix))
+            b[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = self._stream.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+class StagingFile(io.BufferedIOBase):
+    """Binary file kept in a BytesIO until it grows beyond ``max_size``, then moved to a temporary file
+    
+    Unlike SpooledTemporaryFile, whether the contents are still in memory is public
+    (``in_memory``), and ``getbuffer`` gives a zero-copy view of them while they are.
+    """
+    
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._file = io.BytesIO()
+        self.in_memory = True
+    
+    def _spill(self):
+        disk = tempfile.TemporaryFile()
+        disk.write(self._file.getbuffer())
+        disk.seek(self._file.tell())
+        self._file.close()
+        self._file = disk
+        self.in_memory = False
+    
+    def readable(self):
+        return True
+    
+    def writable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def write(self, b):
+        if self.in_memory and self._file.tell() + memoryview(b).nbytes > self._max_size:
+            self._spill()
+        return self._file.write(b)
+    
+    def read(self, size=-1):
+        return self._file.read(size)
+    
+    def read1(self, size=-1):
+        return self._file.read(size)
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._file.seek(offset, whence)
+    
+    def tell(self):
+        return self._file.tell()
+    
+    def truncate(self, size=None):
+        return self._file.truncate(size)
+    
+    def getbuffer(self) -> memoryview:
+        """View of the contents; only available while ``in_memory``"""
+        return self._file.getbuffer()
+    
+    def fileno(self):
+        if self.in_memory:
+            self._spill()  # A file descriptor needs the contents on disk, as SpooledTemporaryFile does
+        return self._file.fileno()
+    
+    def close(self):
+        self._file.close()
+        super().close()
+
 @dataclass
 class FTPConfig:
     """FTP configuration data class"""
@@ -30,6 +185,18 @@ class FTPConfig:
     user: str
     password: str
     target_dir: str = "/home/psyger/ftp/new"
+    data_tls: bool = True  # False leaves the data channel unencrypted (PROT C) so uploads can use sendfile
+    bundle_max_bytes: int = 0  # Staged CSVs up to this size are sent together as one .tar.zst (0 disables)
+    keepalive_interval: float = 30.0  # Seconds between NOOPs that keep the idle persistent connection open
+    timeout: float = 60.0  # Socket timeout for control and data connections, so a vanished server cannot hang us
+
+@dataclass
+class ArrowCSVOptions:
+    """pyarrow equivalents of a source's pandas PARAMS"""
+    read_options: pacsv.ReadOptions
+    parse_options: pacsv.ParseOptions
+    convert_options: pacsv.ConvertOptions
+    skipfooter: int = 0
 
 @dataclass
 class ProcessResult:
@@ -44,6 +211,27 @@ class ETLPipeline:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
         self.ftp_config = self._load_ftp_config()
+        # (connection id, directory) pairs already entered, so repeat uploads skip the CWD
+        self._ftp_dir_ready: Set[Tuple[int, str]] = set()
+        # Parsed config.json and the mtime it was read at, so unchanged files are not re-parsed
+        self._config: Optional[Dict[str, Any]] = None
+        self._config_mtime_ns: Optional[int] = None
+        # One TLS context for every connection, so later handshakes can resume the first session.
+        # Certificates are not verified, matching FTP_TLS's default context.
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+        self._tls_session: Optional[ssl.SSLSession] = None
+        # Persistent control connection, reused across runs and only closed at exit.
+        # The lock serialises its users with the keepalive timer.
+        self._ftp: Optional[FTP_TLS] = None
+        self._ftp_lock = threading.RLock()
+        self._ftp_leases = 0  # Nesting depth of get_ftp_connection
+        self._keepalive: Optional[threading.Timer] = None
+        atexit.register(self.close_ftp_connection)
+        # Parse workers for parallel mode, started on first use and kept across runs
+        self._parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        atexit.register(self.close_parse_pool)
         
     def _load_ftp_config(self) -> FTPConfig:
         """Load FTP configuration from environment variables"""
@@ -52,57 +240,439 @@ class ETLPipeline:
                 host=environ["FTPHOST"],
                 user=environ["FTPUSER"],
                 password=environ["FTPPASS"],
-                target_dir=environ.get("FTPTARGET", "/home/psyger/ftp/new")
+                target_dir=environ.get("FTPTARGET", "/home/psyger/ftp/new"),
+                data_tls=environ.get("FTPDATATLS", "true").lower() not in ("0", "false", "no"),
+                bundle_max_bytes=int(environ.get("FTPBUNDLEMAXBYTES", "0")),
+                keepalive_interval=float(environ.get("FTPKEEPALIVE", "30")),
+                timeout=float(environ.get("FTPTIMEOUT", "60"))
             )
         except KeyError as e:
             logger.error(f"Missing environment variable: {e}")
             raise
     
-    @contextmanager
-    def get_ftp_connection(self):
-        """Context manager for FTP connections with proper cleanup"""
-        ftp = None
-        try:
-            logger.info(f"Connecting to FTP server: {self.ftp_config.host}")
-            ftp = FTP_TLS(self.ftp_config.host)
-            ftp.login(self.ftp_config.user, self.ftp_config.password)
+    def _connect(self) -> FTP_TLS:
+        """Open and log in a new FTP connection"""
+        logger.info("Connecting to FTP server: %s", self.ftp_config.host)
+        ftp = TunedFTP_TLS(self.ftp_config.host, context=self._ssl_context, session=self._tls_session,
+                           timeout=self.ftp_config.timeout)
+        ftp.login(self.ftp_config.user, self.ftp_config.password)
+        if ftp.sock.session_reused:
+            logger.info("Resumed TLS session")
+        self._tls_session = ftp.sock.session
+        if self.ftp_config.data_tls:
             ftp.prot_p()  # Enable protection for data channel
-            logger.info("FTP connection established")
-            yield ftp
-        except Exception as e:
-            logger.error(f"FTP connection failed: {e}")
-            raise
-        finally:
-            if ftp:
+        else:
+            logger.warning("FTPDATATLS is disabled: file contents are sent unencrypted")
+        logger.info("FTP connection established")
+        return ftp
+    
+    def _discard_ftp(self, graceful: bool = True):
+        """Close the persistent connection, if any, and forget its state
+        
+        ``graceful=False`` skips the QUIT, for connections whose replies may be out of step.
+        """
+        ftp, self._ftp = self._ftp, None
+        if ftp:
+            # ids can be reused by later connections, so forget this one's directories
+            self._ftp_dir_ready = {key for key in self._ftp_dir_ready if key[0] != id(ftp)}
+            if not graceful:
+                ftp.close()
+                logger.info("FTP connection dropped")
+                return
+            try:
+                ftp.quit()
+                logger.info("FTP connection closed")
+            except:
+                ftp.close()  # Force close if quit fails
+    
+    @staticmethod
+    def _noop(ftp: FTP_TLS):
+        """Health check: a connection whose replies are in step answers NOOP with exactly 200"""
+        resp = ftp.sendcmd("NOOP")
+        if not resp.startswith("200"):
+            raise error_reply(f"Unexpected NOOP reply: {resp}")
+    
+    def _get_or_reconnect(self, check: bool = True) -> FTP_TLS:
+        """Return the persistent connection if it still answers a NOOP, otherwise reconnect"""
+        if self._ftp is not None and not check:
+            return self._ftp
+        if self._ftp is not None:
+            try:
+                self._noop(self._ftp)
+                return self._ftp
+            except Exception as e:
+                logger.warning(f"FTP connection is stale ({e}), reconnecting")
+                self._discard_ftp(graceful=False)
+        self._ftp = self._connect()
+        return self._ftp
+    
+    def _schedule_keepalive(self):
+        """(Re)arm the timer that NOOPs the idle persistent connection"""
+        if self._keepalive:
+            self._keepalive.cancel()
+        if self._ftp is None or self.ftp_config.keepalive_interval <= 0:
+            return
+        self._keepalive = threading.Timer(self.ftp_config.keepalive_interval, self._send_keepalive)
+        self._keepalive.daemon = True
+        self._keepalive.start()
+    
+    def _send_keepalive(self):
+        """Timer callback: NOOP the connection unless someone is using it"""
+        if not self._ftp_lock.acquire(blocking=False):
+            return  # In use; the user re-arms the timer when done
+        try:
+            if self._ftp is not None:
                 try:
-                    ftp.quit()
-                    logger.info("FTP connection closed")
-                except:
-                    ftp.close()  # Force close if quit fails
+                    self._noop(self._ftp)
+                except Exception as e:
+                    logger.warning(f"FTP keepalive failed ({e}), dropping connection")
+                    self._discard_ftp(graceful=False)
+            self._schedule_keepalive()
+        finally:
+            self._ftp_lock.release()
     
-    def read_csv_with_retry(self, config: Dict[str, Any], max_retries: int = 3) -> pd.DataFrame:
-        """Read CSV with retry logic for network issues"""
-        url = config["URL"]
+    def close_ftp_connection(self):
+        """Stop the keepalive timer and QUIT the persistent connection (registered with atexit)"""
+        with self._ftp_lock:
+            if self._keepalive:
+                self._keepalive.cancel()
+                self._keepalive = None
+            self._discard_ftp()
+    
+    def _get_parse_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Return the parse worker pool, starting it on first use"""
+        if self._parse_pool is None:
+            # spawn, not fork: forking while the uploader thread holds TLS/logging locks can deadlock
+            # workers. Spawned workers re-import pandas and pyarrow, which is why the pool is kept.
+            self._parse_pool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._parse_pool
+    
+    async def _transform_async(self, data: bytes, source_config: Dict[str, Any]) -> bytes:
+        """Run transform_csv in the parse pool, replacing the pool if a dead worker has broken it"""
+        loop = asyncio.get_running_loop()
+        pool = self._get_parse_pool()
+        try:
+            future = loop.run_in_executor(pool, self.transform_csv, data, source_config)
+        except BrokenProcessPool:
+            # A worker died earlier (e.g. killed for memory) and the pool refuses new work for good
+            logger.warning("Parse worker pool is broken, starting a new one")
+            if self._parse_pool is pool:
+                self._parse_pool = None
+            pool.shutdown(wait=False)
+            future = loop.run_in_executor(self._get_parse_pool(), self.transform_csv, data, source_config)
+        return await future
+    
+    def close_parse_pool(self):
+        """Shut down the parse workers, if any were started (registered with atexit)"""
+        pool, self._parse_pool = self._parse_pool, None
+        if pool:
+            pool.shutdown()
+    
+    @contextmanager
+    def get_ftp_connection(self):
+        """Context manager lending out the persistent FTP connection, reconnecting if it went stale
+        
+        Nested uses share the connection without another health check, but still
+        reconnect if an inner use had to discard it.
+        """
+        with self._ftp_lock:
+            if self._keepalive:
+                self._keepalive.cancel()
+            try:
+                ftp = self._get_or_reconnect(check=not self._ftp_leases)
+            except Exception as e:
+                logger.error(f"FTP connection failed: {e}")
+                raise
+            self._ftp_leases += 1
+            try:
+                yield ftp
+            except Exception as e:
+                # An interrupted command or transfer leaves the control channel in an unknown state
+                logger.error(f"FTP connection failed: {e}")
+                self._discard_ftp(graceful=False)
+                raise
+            finally:
+                self._ftp_leases -= 1
+                if not self._ftp_leases:
+                    self._schedule_keepalive()
+    
+    @staticmethod
+    def _csv_chunks(source: Any, config: Dict[str, Any]) -> Iterator[pd.DataFrame]:
+        """Open a chunked pandas reader over a URL or buffer"""
         params = config.get("PARAMS", {})
+        if params.get("skipfooter"):
+            # pandas cannot combine skipfooter with chunked reads
+            return iter([pd.read_csv(source, **params)])
+        return iter(pd.read_csv(source, chunksize=config.get("CHUNKSIZE", DEFAULT_CHUNKSIZE), **params))
+    
+    @staticmethod
+    def _arrow_writes_like_pandas(dtype: Any) -> bool:
+        """Whether Arrow's CSV writer formats values of ``dtype`` the way to_csv does
+        
+        Arrow writes datetimes with a time part and microseconds, durations as raw
+        integers, booleans in lower case and floats in shortest form (``1`` for ``1.0``,
+        ``1e-7`` for ``1e-07``), so those columns go through pandas.
+        """
+        return not (pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype)
+                    or pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_float_dtype(dtype))
+    
+    @staticmethod
+    def _write_frame(chunk: pd.DataFrame, sink: BinaryIO, include_header: bool):
+        """Write a DataFrame chunk as CSV through Arrow's columnar writer, falling back to pandas"""
+        if all(ETLPipeline._arrow_writes_like_pandas(dtype) for dtype in chunk.dtypes):
+            start = sink.tell()
+            try:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=include_header))
+                return
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # Mixed-type object columns have no Arrow type, and nested types have no CSV form
+                sink.seek(start)
+                sink.truncate()
+        chunk.to_csv(sink, header=include_header, index=False)
+    
+    def read_csv_with_retry(self, config: Dict[str, Any], max_retries: int = 3) -> Iterator[pd.DataFrame]:
+        """Read CSV in chunks with retry logic for network issues"""
+        url = config["URL"]
+        
+        for attempt in range(max_retries):
+            try:
+                logger.info("Attempting to read CSV from %s (attempt %d)", url, attempt + 1)
+                chunks = self._csv_chunks(url, config)
+                first_chunk = next(chunks, None)  # Retries cover the request and the first chunk
+                break
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if attempt == max_retries - 1:
+                    logger.error(f"Failed to read CSV after {max_retries} attempts")
+                    raise
+                time.sleep(2 ** attempt)  # Exponential backoff
+        
+        if first_chunk is None:
+            return
+        rows = len(first_chunk)
+        yield first_chunk
+        for chunk in chunks:
+            rows += len(chunk)
+            yield chunk
+        logger.info("Successfully read %d rows from %s", rows, url)
+    
+    @staticmethod
+    def _arrow_csv_options(params: Dict[str, Any]) -> Optional[ArrowCSVOptions]:
+        """Translate pandas PARAMS to pyarrow options, or None if any have no equivalent"""
+        if not set(params) <= ARROW_SUPPORTED_PARAMS:
+            return None
+        skiprows = params.get("skiprows", 0)
+        if not isinstance(skiprows, int):
+            return None
+        # pandas sniffs sep=None and treats longer separators as regexes; Arrow splits on one character
+        delimiter = params.get("sep", params.get("delimiter", ","))
+        if not isinstance(delimiter, str) or len(delimiter) != 1:
+            return None
+        # Per-column (dict) na_values have no Arrow equivalent
+        na_values = params.get("na_values")
+        if na_values is not None and not isinstance(na_values, (str, list)):
+            return None
+        
+        read_options = pacsv.ReadOptions(
+            column_names=params.get("names"),
+            skip_rows=skiprows,
+            encoding=params.get("encoding", "utf8"),
+            block_size=ARROW_BLOCK_SIZE,
+            use_threads=True
+        )
+        parse_options = pacsv.ParseOptions(delimiter=delimiter)
+        if isinstance(na_values, str):
+            na_values = [na_values]
+        # pandas adds na_values to its defaults rather than replacing them
+        convert_options = pacsv.ConvertOptions(
+            null_values=PANDAS_NA_VALUES + [str(v) for v in na_values or []],
+            strings_can_be_null=True
+        )
+        
+        return ArrowCSVOptions(read_options, parse_options, convert_options, params.get("skipfooter", 0))
+    
+    @staticmethod
+    def _drop_footer(data: bytes, skipfooter: int) -> pa.Buffer:
+        """Return a zero-copy view of ``data`` without its last ``skipfooter`` lines"""
+        end = len(data)
+        while end and data[end - 1] in b"\r\n":
+            end -= 1
+        for _ in range(skipfooter):
+            end = data.rfind(b"\n", 0, end)
+            if end < 0:
+                return pa.py_buffer(b"")
+        return pa.py_buffer(data).slice(0, end + 1)
+    
+    @staticmethod
+    def _column_names(head: bytes, options: ArrowCSVOptions) -> List[str]:
+        """Column names of a CSV, from PARAMS or from the header line at the start of ``head``"""
+        if options.read_options.column_names:
+            return list(options.read_options.column_names)
+        end = -1
+        for _ in range(options.read_options.skip_rows + 1):
+            end = head.find(b"\n", end + 1)
+            if end < 0:
+                break
+        header = head if end < 0 else head[:end + 1]
+        return pacsv.read_csv(pa.py_buffer(header), read_options=options.read_options,
+                              parse_options=options.parse_options).column_names
+    
+    @staticmethod
+    def _open_arrow(source: Any, options: ArrowCSVOptions, names: List[str]) -> pacsv.CSVStreamingReader:
+        """Open a streaming reader over a CSV stream or buffer, which parses one block at a time
+        
+        Every column is read as a string, so values are written back exactly as they
+        appeared instead of being re-formatted from an inferred type.
+        """
+        convert_options = pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            null_values=options.convert_options.null_values,
+            strings_can_be_null=True
+        )
+        return pacsv.open_csv(
+            source,
+            read_options=options.read_options,
+            parse_options=options.parse_options,
+            convert_options=convert_options
+        )
+    
+    @staticmethod
+    def _write_batches(reader: pacsv.CSVStreamingReader, sink: BinaryIO) -> int:
+        """Write each record batch from ``reader`` to ``sink`` as CSV, returning the row count
+        
+        Raises pa.ArrowInvalid if the CSV is malformed (e.g. a row with too many
+        fields); the caller falls back to pandas.
+        """
+        rows = 0
+        with pacsv.CSVWriter(sink, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
+    
+    @contextmanager
+    def open_csv_arrow_with_retry(self, config: Dict[str, Any], options: ArrowCSVOptions,
+                                  max_retries: int = 3) -> Iterator[Optional[pacsv.CSVStreamingReader]]:
+        """Open a streaming Arrow reader over the source URL with retry logic for network issues
+        
+        Yields None if ``skipfooter`` leaves nothing to parse: Arrow rejects an empty
+        file where pandas returns an empty frame, so the caller should use pandas.
+        """
+        url = config["URL"]
         
         for attempt in range(max_retries):
             try:
-                logger.info(f"Attempting to read CSV from {url} (attempt {attempt + 1})")
-                df = pd.read_csv(url, **params)
-                logger.info(f"Successfully read {len(df)} rows from {url}")
-                return df
+                logger.info("Attempting to read CSV from %s with pyarrow (attempt %d)", url, attempt + 1)
+                response = requests.get(url, stream=True, timeout=60)
+                try:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    if options.skipfooter:
+                        # The footer has to be cut off before parsing, so buffer the body
+                        content = response.content
+                        body = self._drop_footer(content, options.skipfooter)
+                        reader = self._open_arrow(pa.BufferReader(body), options,
+                                                  self._column_names(content, options)) if body.size else None
+                    else:
+                        # Peek at the first block for the header; retries cover the request and that block
+                        head = response.raw.read(ARROW_BLOCK_SIZE)
+                        reader = self._open_arrow(PrefixedReader(head, response.raw), options,
+                                                  self._column_names(head, options))
+                except Exception:
+                    response.close()
+                    raise
+                break
+            except pa.ArrowInvalid:
+                raise  # A parse error will not go away on retry; the caller falls back to pandas
             except Exception as e:
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to read CSV after {max_retries} attempts")
                     raise
                 time.sleep(2 ** attempt)  # Exponential backoff
+        
+        with response:
+            yield reader
+    
+    def _stage_arrow(self, config: Dict[str, Any], options: ArrowCSVOptions, staged: BinaryIO) -> bool:
+        """Stream the source through Arrow into ``staged``, or return False if pandas has to parse it"""
+        try:
+            with self.open_csv_arrow_with_retry(config, options) as reader:
+                if reader is None:
+                    return False
+                rows = self._write_batches(reader, staged)
+        except pa.ArrowInvalid as e:
+            logger.warning(f"pyarrow could not parse {config['URL']} ({e}), reading it with pandas")
+            staged.seek(0)
+            staged.truncate()
+            return False
+        logger.info("Successfully read %d rows from %s", rows, config["URL"])
+        return True
+    
+    async def fetch_csv_async(self, session: aiohttp.ClientSession, url: str, max_retries: int = 3,
+                              byte_range: Optional[Tuple[int, int]] = None) -> bytes:
+        """Download raw CSV bytes (optionally only the inclusive ``byte_range``) with retry logic"""
+        headers = None
+        if byte_range:
+            # identity: ranges must index the file itself, not a compressed encoding of it
+            headers = {"Range": f"bytes={byte_range[0]}-{byte_range[1]}", "Accept-Encoding": "identity"}
+        
+        for attempt in range(max_retries):
+            try:
+                logger.info("Attempting to download CSV from %s (attempt %d)", url, attempt + 1)
+                async with session.get(url, headers=headers) as response:
+                    response.raise_for_status()
+                    if byte_range and response.status != 206:
+                        raise RuntimeError(f"Server ignored Range request (HTTP {response.status})")
+                    data = await response.read()
+                logger.info("Successfully downloaded %d bytes from %s", len(data), url)
+                return data
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if attempt == max_retries - 1:
+                    logger.error(f"Failed to download CSV after {max_retries} attempts")
+                    raise
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+    
+    @staticmethod
+    def transform_csv(data: bytes, source_config: Dict[str, Any]) -> bytes:
+        """Apply the source's pandas PARAMS to downloaded CSV bytes (runs in a worker process)"""
+        options = ETLPipeline._arrow_csv_options(source_config["PARAMS"])
+        # Zero-copy view of the downloaded bytes keeps the parse vectorized in Arrow
+        buffer = pa.py_buffer(data)
+        if options and options.skipfooter:
+            buffer = ETLPipeline._drop_footer(data, options.skipfooter)
+        if options and buffer.size:  # Empty after skipfooter: pandas returns an empty frame, Arrow fails
+            out = io.BytesIO()
+            try:
+                reader = ETLPipeline._open_arrow(pa.BufferReader(buffer), options,
+                                                 ETLPipeline._column_names(data, options))
+                rows = ETLPipeline._write_batches(reader, out)
+                logger.info("Parsed %d rows", rows)
+                return out.getvalue()
+            except pa.ArrowInvalid as e:
+                logger.warning(f"pyarrow could not parse the CSV ({e}), reading it with pandas")
+        
+        out = io.BytesIO()
+        rows = 0
+        for i, chunk in enumerate(ETLPipeline._csv_chunks(io.BytesIO(data), source_config)):
+            ETLPipeline._write_frame(chunk, out, include_header=(i == 0))
+            rows += len(chunk)
+        logger.info("Parsed %d rows", rows)
+        return out.getvalue()
     
     def ensure_ftp_directory(self, ftp: FTP_TLS, target_dir: str) -> bool:
         """Ensure FTP directory exists, create if necessary"""
+        key = (id(ftp), target_dir)
+        if key in self._ftp_dir_ready:
+            return True
         try:
             ftp.cwd(target_dir)
-            logger.info(f"Successfully navigated to {target_dir}")
+            logger.info("Successfully navigated to %s", target_dir)
+            self._ftp_dir_ready.add(key)
             return True
         except error_perm:
             try:
@@ -116,59 +686,262 @@ class ETLPipeline:
                     except error_perm:
                         ftp.mkd(current_path)
                         ftp.cwd(current_path)
-                logger.info(f"Created and navigated to {target_dir}")
+                logger.info("Created and navigated to %s", target_dir)
+                self._ftp_dir_ready.add(key)
                 return True
             except Exception as e:
                 logger.error(f"Failed to create/navigate to directory {target_dir}: {e}")
                 return False
     
-    def upload_to_ftp(self, ftp: FTP_TLS, file_path: Path) -> bool:
-        """Upload file to FTP server with error handling"""
+    def _zstd_reader(self, fp: BinaryIO, size: int = -1):
+        """Wrap ``fp`` so reads return a zstd-compressed stream of its contents"""
+        compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+        return compressor.stream_reader(fp, size=size)
+    
+    @staticmethod
+    def _in_memory(fp: BinaryIO) -> bool:
+        """Whether ``fp``'s contents are in memory, where ``getbuffer`` can send them without a copy"""
+        return isinstance(fp, io.BytesIO) or (isinstance(fp, StagingFile) and fp.in_memory)
+    
+    def _store_plain(self, ftp: FTP_TLS, remote_name: str, fp: BinaryIO):
+        """STOR over an unencrypted data channel without copying through Python buffers"""
+        ftp.voidcmd("TYPE I")
+        with ftp.transfercmd(f"STOR {remote_name}") as conn:
+            if self._in_memory(fp):
+                with fp.getbuffer() as view:
+                    conn.sendall(view)
+            else:
+                conn.sendfile(fp)  # Kernel-side sendfile(2) from the file descriptor
+        ftp.voidresp()
+    
+    def _zstd_writer(self, fp: BinaryIO):
+        """Wrap ``fp`` so writes to the result are zstd-compressed into it"""
+        compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+        return compressor.stream_writer(fp)
+    
+    def _bundle_eligible(self, file_size: int) -> bool:
+        """Whether a staged CSV is small enough to be held back for the bundle upload"""
+        return 0 < file_size <= self.ftp_config.bundle_max_bytes
+    
+    def upload_bundle(self, members: Dict[str, bytes]) -> bool:
+        """Upload several small CSVs as a single zstd-compressed tar stream in one STOR"""
+        remote_name = f"bundle_{time.strftime('%Y%m%d_%H%M%S')}.tar.zst"
         try:
-            if not self.ensure_ftp_directory(ftp, self.ftp_config.target_dir):
-                return False
-            
-            file_size = file_path.stat().st_size
-            logger.info(f"Uploading {file_path.name} ({file_size} bytes)")
-            
-            with open(file_path, "rb") as fp:
-                ftp.storbinary(f"STOR {file_path.name}", fp)
+            # Errors propagate through the lease, which discards the connection they left out of step
+            with self.get_ftp_connection() as ftp:
+                if not self.ensure_ftp_directory(ftp, self.ftp_config.target_dir):
+                    return False
+                
+                logger.info("Uploading %s (%d files)", remote_name, len(members))
+                ftp.voidcmd("TYPE I")
+                with ftp.transfercmd(f"STOR {remote_name}") as conn:
+                    # Streamed tar ('w|'): members go straight onto the data connection
+                    with conn.makefile("wb") as sink, self._zstd_writer(sink) as compressed, \
+                            tarfile.open(fileobj=compressed, mode="w|") as tar:
+                        for source_name, data in members.items():
+                            info = tarfile.TarInfo(f"{source_name}.csv")
+                            info.size = len(data)
+                            info.mtime = int(time.time())
+                            tar.addfile(info, io.BytesIO(data))
+                    if isinstance(conn, ssl.SSLSocket):
+                        conn.unwrap()  # Shut down TLS cleanly, as storbinary does
+                ftp.voidresp()
             
-            logger.info(f"Successfully uploaded {file_path.name}")
+            logger.info("Successfully uploaded %s", remote_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to upload {file_path.name}: {e}")
+            logger.error(f"Failed to upload {remote_name}: {e}")
             return False
     
-    def safe_delete_file(self, file_path: Path) -> bool:
-        """Safely delete file with error handling"""
+    def _upload_held_back(self, bundle: Dict[str, bytes], results: Dict[str, ProcessResult]):
+        """Upload the CSVs held back for bundling and record the outcome for each source"""
+        if not bundle:
+            return
+        start_time = time.time()
+        upload_success = self.upload_bundle(bundle)
+        for source_name, data in bundle.items():
+            held_back = results[source_name]
+            results[source_name] = ProcessResult(
+                source_name=source_name,
+                success=upload_success,
+                message="Successfully processed (bundled)" if upload_success else "Failed to upload bundle to FTP",
+                file_size=len(data),
+                processing_time=(held_back.processing_time or 0) + time.time() - start_time
+            )
+    
+    def upload_to_ftp(self, remote_name: str, fp: BinaryIO, file_size: int, compress: bool = False) -> bool:
+        """Upload a file object of ``file_size`` bytes to FTP server with error handling
+        
+        Like streamed sources, the file is stored under a temporary name and renamed
+        into place once complete.
+        """
         try:
-            if file_path.exists():
-                remove(file_path)
-                logger.info(f"Deleted local file: {file_path.name}")
-                return True
+            # Errors propagate through the lease, which discards the connection they left out of step
+            with self.get_ftp_connection() as ftp:
+                if not self.ensure_ftp_directory(ftp, self.ftp_config.target_dir):
+                    return False
+                
+                fp.seek(0)
+                if compress:
+                    remote_name = f"{remote_name}.zst"
+                partial_name = f"{remote_name}.partial"
+                
+                if not self.ftp_config.data_tls and not compress:
+                    logger.info("Uploading %s (%d bytes) over the plain data channel", remote_name, file_size)
+                    self._store_plain(ftp, partial_name, fp)
+                elif compress:
+                    logger.info("Uploading %s (%d bytes before compression)", remote_name, file_size)
+                    with self._zstd_reader(fp, file_size) as reader:
+                        ftp.storbinary(f"STOR {partial_name}", reader, blocksize=TRANSFER_BLOCKSIZE)
+                else:
+                    logger.info("Uploading %s (%d bytes)", remote_name, file_size)
+                    ftp.storbinary(f"STOR {partial_name}", fp, blocksize=TRANSFER_BLOCKSIZE)
+                ftp.rename(partial_name, remote_name)
+            
+            logger.info("Successfully uploaded %s", remote_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete {file_path.name}: {e}")
+            logger.error(f"Failed to upload {remote_name}: {e}")
             return False
     
-    def process_single_source(self, source_name: str, source_config: Dict[str, Any]) -> ProcessResult:
-        """Process a single data source"""
-        start_time = time.time()
-        file_path = Path(f"{source_name}.csv")
+    def remove_stale_parts(self, source_name: str):
+        """Delete the ``<name>.partK.csv`` files left by an earlier byte-range upload
         
+        A run that splits a source into fewer shards would otherwise leave the extra
+        parts of a previous run next to its own.
+        """
+        stale = re.compile(rf"{re.escape(source_name)}\.part\d+\.csv(\.zst)?")
         try:
-            # Read CSV data
-            df = self.read_csv_with_retry(source_config)
-            
-            # Save to local file
-            df.to_csv(file_path, index=False)
-            file_size = file_path.stat().st_size
-            logger.info(f"Saved {source_name}.csv ({file_size} bytes)")
-            
-            # Upload to FTP
             with self.get_ftp_connection() as ftp:
-                upload_success = self.upload_to_ftp(ftp, file_path)
+                if not self.ensure_ftp_directory(ftp, self.ftp_config.target_dir):
+                    return
+                try:
+                    names = ftp.nlst()
+                except error_perm:
+                    names = []  # Some servers answer 550 for an empty directory
+                for name in names:
+                    if stale.fullmatch(posixpath.basename(name)):
+                        ftp.delete(name)
+                        logger.info("Removed stale part %s", name)
+        except Exception as e:
+            logger.warning(f"Could not remove stale parts of {source_name}: {e}")
+    
+    def _store_stream(self, ftp: FTP_TLS, remote_name: str, source: BinaryIO) -> int:
+        """STOR a stream that may fail mid-way, returning the number of bytes sent
+        
+        When reading ``source`` fails, the transfer's final reply is still collected
+        (keeping the control channel in step) and the partial file is deleted.
+        """
+        transferred = 0
+        ftp.voidcmd("TYPE I")
+        try:
+            with ftp.transfercmd(f"STOR {remote_name}") as conn:
+                while block := source.read(TRANSFER_BLOCKSIZE):
+                    conn.sendall(block)
+                    transferred += len(block)
+                if isinstance(conn, ssl.SSLSocket):
+                    conn.unwrap()  # Shut down TLS cleanly, as storbinary does
+        except Exception:
+            try:
+                ftp.voidresp()  # Usually 426, now that the data connection is closed
+            except all_errors:
+                pass
+            try:
+                ftp.delete(remote_name)
+            except Exception as e:
+                logger.warning(f"Could not remove partial upload {remote_name}: {e}")
+            raise
+        ftp.voidresp()
+        return transferred
+    
+    def stream_passthrough(self, source_name: str, source_config: Dict[str, Any], max_retries: int = 3) -> int:
+        """Stream a CSV from HTTP straight into an FTP upload without parsing it
+        
+        The stream is stored under a temporary name and only renamed into place once
+        it is complete, so consumers of the target folder never see a truncated file.
+        """
+        url = source_config["URL"]
+        compress = source_config.get("COMPRESS", False)
+        remote_name = f"{source_name}.csv.zst" if compress else f"{source_name}.csv"
+        partial_name = f"{remote_name}.partial"
+        
+        for attempt in range(max_retries):
+            try:
+                logger.info("Streaming %s to %s (attempt %d)", url, remote_name, attempt + 1)
+                with requests.get(url, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True  # Undo any gzip transfer encoding
+                    source = self._zstd_reader(response.raw) if compress else response.raw
+                    # A failed attempt discards the connection, so the retry starts on a fresh one
+                    with self.get_ftp_connection() as ftp:
+                        if not self.ensure_ftp_directory(ftp, self.ftp_config.target_dir):
+                            raise RuntimeError("Failed to access FTP target directory")
+                        transferred = self._store_stream(ftp, partial_name, source)
+                        ftp.rename(partial_name, remote_name)
+                logger.info("Successfully streamed %s (%d bytes)", remote_name, transferred)
+                return transferred
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if attempt == max_retries - 1:
+                    logger.error(f"Failed to stream {url} after {max_retries} attempts")
+                    raise
+                time.sleep(2 ** attempt)  # Exponential backoff
+    
+    def process_single_source(self, source_name: str, source_config: Dict[str, Any],
+                              bundle: Optional[Dict[str, bytes]] = None) -> ProcessResult:
+        """Process a single data source on the persistent FTP connection
+        
+        Small CSVs are added to ``bundle`` instead of uploaded when bundling is enabled.
+        """
+        start_time = time.time()
+        remote_name = f"{source_name}.csv"
+        
+        if not source_config.get("PARAMS"):
+            # Nothing to transform: skip pandas and local staging entirely
+            try:
+                file_size = self.stream_passthrough(source_name, source_config)
+                return ProcessResult(
+                    source_name=source_name,
+                    success=True,
+                    message="Successfully streamed",
+                    file_size=file_size,
+                    processing_time=time.time() - start_time
+                )
+            except Exception as e:
+                return ProcessResult(
+                    source_name=source_name,
+                    success=False,
+                    message=f"Error: {str(e)}",
+                    processing_time=time.time() - start_time
+                )
+        
+        # Staged in memory; only spills to a temporary file for very large sources
+        max_in_memory = source_config.get("IN_MEMORY_MAX_BYTES", IN_MEMORY_MAX_BYTES)
+        with StagingFile(max_in_memory) as staged:
+            try:
+                arrow_options = self._arrow_csv_options(source_config["PARAMS"])
+                # Arrow parses and writes one columnar block at a time, no pandas round-trip
+                if not (arrow_options and self._stage_arrow(source_config, arrow_options, staged)):
+                    # Read CSV data chunk by chunk and append each to the staging buffer
+                    for i, chunk in enumerate(self.read_csv_with_retry(source_config)):
+                        self._write_frame(chunk, staged, include_header=(i == 0))
+                file_size = staged.tell()
+                logger.info("Staged %s (%d bytes)", remote_name, file_size)
+                
+                if bundle is not None and self._bundle_eligible(file_size):
+                    staged.seek(0)
+                    bundle[source_name] = staged.read()
+                    return ProcessResult(
+                        source_name=source_name,
+                        success=True,
+                        message="Held back for bundle upload",
+                        file_size=file_size,
+                        processing_time=time.time() - start_time
+                    )
+                
+                # Upload to FTP
+                upload_success = self.upload_to_ftp(remote_name, staged, file_size,
+                                                    compress=source_config.get("COMPRESS", False))
                 if not upload_success:
                     return ProcessResult(
                         source_name=source_name,
@@ -177,36 +950,36 @@ class ETLPipeline:
                         file_size=file_size,
                         processing_time=time.time() - start_time
                     )
-            
-            # Clean up local file
-            self.safe_delete_file(file_path)
-            
-            processing_time = time.time() - start_time
-            return ProcessResult(
-                source_name=source_name,
-                success=True,
-                message="Successfully processed",
-                file_size=file_size,
-                processing_time=processing_time
-            )
-            
-        except Exception as e:
-            # Ensure cleanup on error
-            self.safe_delete_file(file_path)
-            return ProcessResult(
-                source_name=source_name,
-                success=False,
-                message=f"Error: {str(e)}",
-                processing_time=time.time() - start_time
-            )
+                
+                processing_time = time.time() - start_time
+                return ProcessResult(
+                    source_name=source_name,
+                    success=True,
+                    message="Successfully processed",
+                    file_size=file_size,
+                    processing_time=processing_time
+                )
+                
+            except Exception as e:
+                return ProcessResult(
+                    source_name=source_name,
+                    success=False,
+                    message=f"Error: {str(e)}",
+                    processing_time=time.time() - start_time
+                )
     
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file, reusing the last parse if the file is unchanged"""
         try:
-            with open(self.config_file, 'r') as fp:
-                config = json.load(fp)
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+            if self._config is not None and mtime_ns == self._config_mtime_ns:
+                return self._config
+            
+            with open(self.config_file, 'rb') as fp:
+                config = orjson.loads(fp.read())
                 logger.info(f"Loaded configuration for {len(config)} sources")
-                return config
+            self._config, self._config_mtime_ns = config, mtime_ns
+            return config
         except Exception as e:
             logger.error(f"Failed to load config file: {e}")
             raise
@@ -217,53 +990,305 @@ class ETLPipeline:
         config = self.load_config()
         results = {}
         
-        for source_name, source_config in config.items():
-            logger.info(f"Processing source: {source_name}")
-            result = self.process_single_source(source_name, source_config)
-            results[source_name] = result
-            
-            if result.success:
-                logger.info(f"✓ {source_name}: {result.message} ({result.processing_time:.2f}s)")
+        # One connection (and one TLS handshake) for the whole run; sources re-lease it,
+        # so one that had to discard a broken connection does not break the rest
+        with ExitStack() as stack:
+            try:
+                ftp = stack.enter_context(self.get_ftp_connection())
+            except Exception as e:
+                # Report it per source instead of raising, which would stop the scheduler for good
+                error = f"Error: {str(e)}"
             else:
-                logger.error(f"✗ {source_name}: {result.message}")
+                error = None
+                if not self.ensure_ftp_directory(ftp, self.ftp_config.target_dir):
+                    error = "Failed to access FTP target directory"
+            if error:
+                for source_name in config:
+                    results[source_name] = ProcessResult(
+                        source_name=source_name,
+                        success=False,
+                        message=error
+                    )
+                    logger.error(f"✗ {source_name}: {error}")
+                return results
+            
+            bundle = {} if self.ftp_config.bundle_max_bytes else None
+            for source_name, source_config in config.items():
+                logger.info("Processing source: %s", source_name)
+                result = self.process_single_source(source_name, source_config, bundle=bundle)
+                results[source_name] = result
+                
+                if result.success:
+                    logger.info("✓ %s: %s (%.2fs)", source_name, result.message, result.processing_time)
+                else:
+                    logger.error(f"✗ {source_name}: {result.message}")
+            
+            if bundle:
+                self._upload_held_back(bundle, results)
         
         return results
     
-    def run_parallel(self, max_workers: int = 4) -> Dict[str, ProcessResult]:
-        """Run pipeline in parallel with controlled concurrency"""
-        logger.info(f"Starting parallel processing with {max_workers} workers")
-        config = self.load_config()
-        results = {}
+    async def _content_length(self, session: aiohttp.ClientSession, url: str) -> Optional[int]:
+        """Size of the resource if the server supports byte-range requests for it, else None
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_source = {
-                executor.submit(self.process_single_source, source_name, source_config): source_name
-                for source_name, source_config in config.items()
-            }
+        Probes with a one-byte ranged GET rather than HEAD, which many APIs and
+        pre-signed URLs reject.
+        """
+        try:
+            async with session.get(url, headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"}) as response:
+                if response.status != 206:
+                    response.close()  # Ranges are ignored; do not download the whole body here
+                    return None
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                return int(total) if total.isdigit() else None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Byte-range probe of {url} failed: {e}")
+            return None
+    
+    @staticmethod
+    async def _aligned_shards(fetches: List[asyncio.Future]) -> AsyncIterator[Tuple[bytes, bool]]:
+        """Yield ``(shard, is_last)`` in file order, each resynced to end on a line boundary
+        
+        A shard is yielded as soon as the range after it has arrived, since that range's
+        leading partial line is the end of the shard's last line.
+        """
+        ready = None  # Aligned, but held back until it is known whether another shard follows
+        pending = await fetches[0]
+        for fetch in fetches[1:]:
+            shard = await fetch
+            newline = shard.find(b"\n")
+            if newline < 0:
+                pending += shard  # No line break at all: the whole shard continues a line
+                continue
+            if ready is not None:
+                yield ready, False
+            ready, pending = pending + shard[:newline + 1], shard[newline + 1:]
+        if pending:
+            if ready is not None:
+                yield ready, False
+            ready = pending
+        if ready:
+            yield ready, True
+    
+    @staticmethod
+    def _header_line(params: Dict[str, Any]) -> Optional[int]:
+        """Index of the raw line pandas takes the column names from, or None if there is none
+        
+        Only called for PARAMS that pass ``_shardable``, so skiprows and header are integers.
+        """
+        header = params.get("header", "infer")
+        if header is None or (header == "infer" and "names" in params):
+            return None
+        return params.get("skiprows", 0) + (0 if header == "infer" else header)
+    
+    @staticmethod
+    def _shardable(params: Dict[str, Any]) -> bool:
+        """Whether the header can be located without parsing, as sharding needs"""
+        header = params.get("header", "infer")
+        return isinstance(params.get("skiprows", 0), int) and (header in ("infer", None) or isinstance(header, int))
+    
+    @staticmethod
+    def _shard_config(source_config: Dict[str, Any], index: int, last: bool) -> Dict[str, Any]:
+        """PARAMS for one shard: skiprows only apply to the first, skipfooter only to the last"""
+        params = dict(source_config.get("PARAMS", {}))
+        if index > 0:
+            params.pop("skiprows", None)
+            if "header" in params:
+                # Later shards start with the copied header line, or straight with data if there is none
+                params["header"] = None if ETLPipeline._header_line(source_config["PARAMS"]) is None else 0
+        if not last:
+            params.pop("skipfooter", None)
+        return dict(source_config, PARAMS=params)
+    
+    async def fetch_shards_async(self, session: aiohttp.ClientSession, upload_queue: asyncio.Queue, source_name: str, source_config: Dict[str, Any],
+                                 start_time: float) -> bool:
+        """Download a large CSV as parallel byte ranges, queueing each shard for upload as it is ready
+        
+        Shards are transformed and queued one at a time, in order, while later ranges are
+        still downloading. Returns False when the server does not support ranges, so the
+        caller can fall back to a normal download.
+        """
+        url = source_config["URL"]
+        params = source_config.get("PARAMS")
+        if params and not self._shardable(params):
+            logger.warning("%s needs integer skiprows and header to be split, downloading it in one piece", url)
+            return False
+        size = await self._content_length(session, url)
+        if not size:
+            logger.warning("%s does not support byte ranges, downloading it in one piece", url)
+            return False
+        
+        count = max(1, min(int(source_config["BYTE_RANGE_PARALLEL"]), size))
+        bounds = [size * i // count for i in range(count + 1)]
+        fetches = [
+            asyncio.ensure_future(self.fetch_csv_async(session, url, byte_range=(bounds[i], bounds[i + 1] - 1)))
+            for i in range(count)
+        ]
+        header_line = self._header_line(params) if params else None
+        header = b""
+        try:
+            part = 0
+            async for shard, last in self._aligned_shards(fetches):
+                if params:
+                    if part == 0 and header_line is not None:
+                        # pandas/Arrow take the column names from the header line, so every shard needs a copy
+                        lines = shard.split(b"\n", header_line + 1)
+                        header = lines[min(header_line, len(lines) - 1)] + b"\n"
+                    elif part > 0:
+                        shard = header + shard
+                    shard = await self._transform_async(shard, self._shard_config(source_config, part, last))
+                await upload_queue.put((source_name, part, source_config, shard, start_time))
+                part += 1
+        finally:
+            # After a failure, stop the remaining downloads and collect their outcomes
+            for fetch in fetches:
+                fetch.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
+        return True
+    
+    async def process_single_source_async(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                          upload_queue: asyncio.Queue,
+                                          source_name: str, source_config: Dict[str, Any]) -> Optional[ProcessResult]:
+        """Download and transform a single data source, then queue it for upload
+        
+        Sources without PARAMS are queued without data; the uploader streams them
+        from HTTP to FTP itself, so they are never held in memory.
+        """
+        start_time = time.time()
+        async with semaphore:
+            try:
+                if source_config.get("BYTE_RANGE_PARALLEL"):
+                    if await self.fetch_shards_async(session, upload_queue, source_name, source_config, start_time):
+                        return None
+                
+                data = None
+                if source_config.get("PARAMS"):
+                    data = await self.fetch_csv_async(session, source_config["URL"])
+                    # Parsing is CPU-bound and holds the GIL, so it goes to another process
+                    data = await self._transform_async(data, source_config)
+            except Exception as e:
+                return ProcessResult(
+                    source_name=source_name,
+                    success=False,
+                    message=f"Error: {str(e)}",
+                    processing_time=time.time() - start_time
+                )
             
-            # Collect results
-            for future in concurrent.futures.as_completed(future_to_source):
-                source_name = future_to_source[future]
-                try:
-                    result = future.result()
-                    results[source_name] = result
-                    
-                    if result.success:
-                        logger.info(f"✓ {source_name}: {result.message} ({result.processing_time:.2f}s)")
+            # Still holding the semaphore: while the uploader is behind, no other source starts
+            # downloading, so at most max_concurrency + UPLOAD_QUEUE_SIZE CSVs are held at once
+            await upload_queue.put((source_name, None, source_config, data, start_time))
+        return None
+    
+    async def _upload_worker(self, upload_queue: asyncio.Queue, results: Dict[str, ProcessResult]):
+        """Upload queued CSVs one after another over a single FTP connection"""
+        # ftplib blocks, so FTP calls run off the loop; always on the same thread, because
+        # the connection lock taken on enter must be released by the thread that took it
+        ftp_thread = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        loop = asyncio.get_running_loop()
+        stack = ExitStack()
+        ftp = None
+        error = "Failed to upload to FTP"
+        try:
+            # Held for the whole run; each upload re-leases it, so one that had to discard a
+            # broken connection gets it replaced for the next
+            ftp = await loop.run_in_executor(ftp_thread, stack.enter_context, self.get_ftp_connection())
+        except Exception as e:
+            error = f"Error: {str(e)}"
+        
+        bundle = {}
+        try:
+            while (item := await upload_queue.get()) is not None:
+                source_name, part, source_config, data, start_time = item
+                if data is None:
+                    # Passthrough source: stream it now, on the FTP thread
+                    if ftp is None:
+                        results[source_name] = ProcessResult(source_name=source_name, success=False, message=error)
                     else:
-                        logger.error(f"✗ {source_name}: {result.message}")
-                        
-                except Exception as e:
-                    logger.error(f"✗ {source_name}: Unexpected error: {e}")
+                        results[source_name] = await loop.run_in_executor(
+                            ftp_thread, self.process_single_source, source_name, source_config
+                        )
+                    continue
+                if part is None and ftp is not None and self._bundle_eligible(len(data)):
+                    bundle[source_name] = data
                     results[source_name] = ProcessResult(
                         source_name=source_name,
-                        success=False,
-                        message=f"Unexpected error: {str(e)}"
+                        success=True,
+                        message="Held back for bundle upload",
+                        file_size=len(data),
+                        processing_time=time.time() - start_time
                     )
+                    continue
+                if part == 0 and ftp is not None:
+                    await loop.run_in_executor(ftp_thread, self.remove_stale_parts, source_name)
+                remote_name = f"{source_name}.csv" if part is None else f"{source_name}.part{part}.csv"
+                upload_success = ftp is not None and await loop.run_in_executor(
+                    ftp_thread, self.upload_to_ftp, remote_name, io.BytesIO(data), len(data),
+                    source_config.get("COMPRESS", False)
+                )
+                file_size = len(data)
+                if part:
+                    # Later shards of a byte-range source fold into the result of the first
+                    previous = results[source_name]
+                    upload_success = upload_success and previous.success
+                    file_size += previous.file_size
+                results[source_name] = ProcessResult(
+                    source_name=source_name,
+                    success=upload_success,
+                    message="Successfully processed" if upload_success else error,
+                    file_size=file_size,
+                    processing_time=time.time() - start_time
+                )
+            
+            if bundle:
+                await loop.run_in_executor(ftp_thread, self._upload_held_back, bundle, results)
+        finally:
+            await loop.run_in_executor(ftp_thread, stack.close)
+            ftp_thread.shutdown()
+    
+    async def _run_async(self, config: Dict[str, Any], max_concurrency: int) -> Dict[str, ProcessResult]:
+        """Download sources concurrently, at most ``max_concurrency`` at a time, and upload them in turn"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        upload_queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        uploaded = {}
+        uploader = asyncio.create_task(self._upload_worker(upload_queue, uploaded))
+        timeout = aiohttp.ClientTimeout(sock_connect=60, sock_read=60)
+        
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            outcomes = await asyncio.gather(
+                *(self.process_single_source_async(session, semaphore, upload_queue,
+                                                   source_name, source_config)
+                  for source_name, source_config in config.items()),
+                return_exceptions=True
+            )
+        await upload_queue.put(None)
+        await uploader
+        
+        results = {}
+        for source_name, outcome in zip(config, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"✗ {source_name}: Unexpected error: {outcome}")
+                results[source_name] = ProcessResult(
+                    source_name=source_name,
+                    success=False,
+                    message=f"Unexpected error: {str(outcome)}"
+                )
+                continue
+            
+            result = outcome or uploaded[source_name]
+            results[source_name] = result
+            if result.success:
+                logger.info("✓ %s: %s (%.2fs)", source_name, result.message, result.processing_time)
+            else:
+                logger.error(f"✗ {source_name}: {result.message}")
         
         return results
     
+    def run_parallel(self, max_workers: int = 4) -> Dict[str, ProcessResult]:
+        """Run pipeline concurrently on an asyncio event loop with controlled concurrency"""
+        logger.info(f"Starting parallel processing with {max_workers} concurrent sources")
+        config = self.load_config()
+        return asyncio.run(self._run_async(config, max_workers))
+    
     def print_summary(self, results: Dict[str, ProcessResult]):
         """Print summary of processing results"""
         successful = sum(1 for r in results.values() if r.success)
@@ -315,8 +1340,12 @@ def main():
         logger.info("Scheduler started. Press Ctrl+C to stop.")
         try:
             while True:
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    break  # No jobs left
+                if idle_seconds > 0:
+                    time.sleep(idle_seconds)  # Sleep until the next run instead of polling
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute instead of every second
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
     